@@ -2,15 +2,22 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 import shutil
 import subprocess
 import sys
+import threading
+from typing import TYPE_CHECKING
 
 ROOT = Path(__file__).resolve().parents[1]
+WARMUP_WAIT_SECONDS = 5.0
 sys.path.insert(0, str(ROOT / "src"))
 
-from tts_test.voice_profiles import load_voice_profiles
+from tts_test.voice_profiles import VoiceProfile, load_voice_profiles
+
+if TYPE_CHECKING:
+    from tts_test.elevenlabs_tts import ElevenLabsTTS
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -60,11 +67,27 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Disable writing ElevenLabs response metadata JSON sidecar",
     )
+    parser.add_argument(
+        "--timestamps",
+        action="store_true",
+        help="Include ElevenLabs alignment/timestamp data in the metadata sidecar",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=8,
+        help="Batch mode: number of lines to synthesize in parallel",
+    )
     parser.add_argument(
         "--play",
         action="store_true",
         help="Play the generated audio file after synthesis",
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Play audio while it is being synthesized (via ffplay); no file is saved",
+    )
     parser.add_argument(
         "--list",
         action="store_true",
@@ -75,9 +98,9 @@ def build_parser() -> argparse.ArgumentParser:
 
 def main() -> int:
     args = build_parser().parse_args()
-    profiles, default_profile = load_voice_profiles(args.config)
 
     if args.list:
+        profiles, default_profile = load_voice_profiles(args.config)
         print("Available profiles:")
         for name, profile in profiles.items():
             marker = " (default)" if name == default_profile else ""
@@ -86,15 +109,34 @@ def main() -> int:
             )
         return 0
 
-    chosen_name = args.profile or default_profile
-    if chosen_name not in profiles:
-        valid = ", ".join(sorted(profiles.keys()))
-        raise ValueError(f"Unknown profile '{chosen_name}'. Valid profiles: {valid}")
+    if args.stream and args.input_file:
+        raise ValueError("--stream cannot be combined with --input-file")
 
     from tts_test.elevenlabs_tts import ElevenLabsTTS
 
-    profile = profiles[chosen_name]
-    tts = ElevenLabsTTS()
+    with ElevenLabsTTS() as tts:
+        # Prime a pooled connection while profiles are loaded and resolved.
+        warmup = threading.Thread(target=tts.warmup, daemon=True)
+        warmup.start()
+        profiles, default_profile = load_voice_profiles(args.config)
+        chosen_name = args.profile or default_profile
+        if chosen_name not in profiles:
+            valid = ", ".join(sorted(profiles.keys()))
+            raise ValueError(
+                f"Unknown profile '{chosen_name}'. Valid profiles: {valid}"
+            )
+        # httpx can't hand out a connection that is still handshaking, so wait
+        # for it to land in the pool; otherwise the first request opens its own.
+        warmup.join(timeout=WARMUP_WAIT_SECONDS)
+        return _run(args, profiles[chosen_name], tts)
+
+
+def _run(args: argparse.Namespace, profile: VoiceProfile, tts: ElevenLabsTTS) -> int:
+    if args.stream:
+        print(f"Profile: {profile.name} (voiceId={profile.voice_id})")
+        tts.stream_to_player(args.text, profile)
+        print("Playback: completed")
+        return 0
 
     if args.input_file:
         texts = _read_input_lines(args.input_file)
@@ -103,22 +145,45 @@ def main() -> int:
 
         print(f"Batch mode: {len(texts)} lines from {args.input_file}")
         print(f"Profile: {profile.name} (voiceId={profile.voice_id})")
-        for idx, text in enumerate(texts, start=1):
-            prefix = f"{args.name}_{idx:03d}" if args.name else f"{idx:03d}"
-            output_path, metadata_path = tts.text_to_speech_file(
-                text=text,
-                profile=profile,
-                output_dir=args.output_dir,
-                output_format=args.format,
-                filename_prefix=prefix,
-                save_metadata=not args.no_metadata,
-            )
-            print(f"[{idx}/{len(texts)}] Saved: {output_path}")
-            if metadata_path:
-                print(f"[{idx}/{len(texts)}] Metadata: {metadata_path}")
-            if args.play and idx == 1:
-                _play_audio(output_path)
-                print("Playback: completed (first item only)")
+        total = len(texts)
+        args.output_dir.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            futures = {}
+            for idx, text in enumerate(texts, start=1):
+                prefix = f"{args.name}_{idx:03d}" if args.name else f"{idx:03d}"
+                future = executor.submit(
+                    tts.text_to_speech_file,
+                    text=text,
+                    profile=profile,
+                    output_dir=args.output_dir,
+                    output_format=args.format,
+                    filename_prefix=prefix,
+                    save_metadata=not args.no_metadata,
+                    include_timestamps=args.timestamps,
+                    skip_mkdir=True,
+                )
+                futures[future] = idx
+            reported: set[Future] = set()
+            try:
+                for future in as_completed(futures):
+                    idx = futures[future]
+                    output_path, metadata_path = future.result()
+                    reported.add(future)
+                    _print_saved(idx, total, output_path, metadata_path)
+                    if args.play and idx == 1:
+                        _play_audio(output_path)
+                        print("Playback: completed (first item only)")
+            except BaseException:
+                # Stop at the first failure (or Ctrl-C) instead of letting the
+                # remaining queued lines run up paid synthesis calls. Lines
+                # already in flight can't be cancelled, so let them finish and
+                # report what made it to disk before re-raising.
+                executor.shutdown(wait=True, cancel_futures=True)
+                for future, idx in sorted(futures.items(), key=lambda item: item[1]):
+                    if future in reported or future.cancelled() or future.exception():
+                        continue
+                    _print_saved(idx, total, *future.result())
+                raise
         return 0
 
     output_path, metadata_path = tts.text_to_speech_file(
@@ -128,6 +193,7 @@ def main() -> int:
         output_format=args.format,
         filename_prefix=args.name,
         save_metadata=not args.no_metadata,
+        include_timestamps=args.timestamps,
     )
 
     print(f"Saved: {output_path}")
@@ -140,6 +206,24 @@ def main() -> int:
     return 0
 
 
+def _print_saved(
+    idx: int, total: int, output_path: Path, metadata_path: Path | None
+) -> None:
+    print(f"[{idx}/{total}] Saved: {output_path}")
+    if metadata_path:
+        print(f"[{idx}/{total}] Metadata: {metadata_path}")
+
+
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
+
+
 def _play_audio(audio_path: Path) -> None:
     candidates = [
         ["afplay", str(audio_path)],
@@ -157,13 +241,13 @@ def _play_audio(audio_path: Path) -> None:
 
 
 def _read_input_lines(input_file: Path) -> list[str]:
-    lines: list[str] = []
-    for raw_line in input_file.read_text(encoding="utf-8").splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
-        lines.append(line)
-    return lines
+    # Filter on bytes and only decode the lines that are kept.
+    stripped = (raw_line.strip() for raw_line in input_file.read_bytes().splitlines())
+    return [
+        line.decode("utf-8")
+        for line in stripped
+        if line and not line.startswith(b"#")
+    ]
 
 
 if __name__ == "__main__":
@@ -1,19 +1,56 @@
 from __future__ import annotations
 
-import base64
+import binascii
 import json
 import os
-import uuid
-import wave
+import queue
+import secrets
+import shutil
+import struct
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Iterable, Iterator
 
+import httpx
+import orjson
 from dotenv import load_dotenv
 from elevenlabs import VoiceSettings
 from elevenlabs.client import ElevenLabs
+from pydantic import BaseModel
 
 from .voice_profiles import VoiceProfile
 
+_API_BASE_URL = "https://api.elevenlabs.io"
+_HTTP_POOL_SIZE = 32
+_STREAM_QUEUE_SIZE = 4
+_WRITE_BUFFER_SIZE = 1 << 20
+_AUDIO_KEYS = ("audio_base64", "audio_base_64", "audio")
+# Multiple of 4 so every slice of a base64 string decodes independently.
+_BASE64_DECODE_CHUNK = 256 * 1024
+
+# Canonical 44-byte RIFF/WAVE header for 16 kHz mono 16-bit PCM. Only the
+# RIFF size (offset 4) and data size (offset 40) depend on the payload.
+_PCM16K_HEADER_TEMPLATE = struct.pack(
+    "<4sI4s4sIHHIIHH4sI",
+    b"RIFF",
+    36,
+    b"WAVE",
+    b"fmt ",
+    16,
+    1,
+    1,
+    16000,
+    32000,
+    2,
+    16,
+    b"data",
+    0,
+)
+
 
 class ElevenLabsTTS:
     def __init__(self, api_key: str | None = None) -> None:
@@ -21,7 +58,46 @@ class ElevenLabsTTS:
         key = api_key or os.getenv("ELEVENLABS_API_KEY")
         if not key:
             raise ValueError("ELEVENLABS_API_KEY is not set. Add it to .env.")
-        self.client = ElevenLabs(api_key=key)
+        self._local = threading.local()
+        # One pooled client shared by every request so batch runs reuse
+        # warm keep-alive connections instead of paying a TLS handshake each.
+        self._httpx = httpx.Client(
+            limits=httpx.Limits(
+                max_keepalive_connections=_HTTP_POOL_SIZE,
+                max_connections=_HTTP_POOL_SIZE,
+            ),
+            # The SDK re-applies timeout.read as a flat per-request timeout, so
+            # finer-grained (e.g. connect-only) limits would not take effect.
+            timeout=60.0,
+            event_hooks={"response": [self._capture_response_headers]},
+        )
+        self._api_key = key
+        self.client = ElevenLabs(
+            api_key=key, base_url=_API_BASE_URL, httpx_client=self._httpx
+        )
+
+    def warmup(self) -> None:
+        # Best effort: a cheap HEAD leaves a connection with DNS, TCP and TLS
+        # already done in the pool for the first real request to reuse.
+        if self._httpx.is_closed:
+            return
+        try:
+            self._httpx.head(
+                f"{_API_BASE_URL}/v1/models",
+                headers={"xi-api-key": self._api_key},
+            )
+        except Exception:
+            # Includes RuntimeError if close() wins the race with this thread.
+            pass
+
+    def close(self) -> None:
+        self._httpx.close()
+
+    def __enter__(self) -> ElevenLabsTTS:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def text_to_speech_file(
         self,
@@ -31,122 +107,159 @@ class ElevenLabsTTS:
         output_format: str,
         filename_prefix: str | None = None,
         save_metadata: bool = True,
+        include_timestamps: bool = False,
+        skip_mkdir: bool = False,
     ) -> tuple[Path, Path | None]:
-        output_dir.mkdir(parents=True, exist_ok=True)
-        file_id = filename_prefix or str(uuid.uuid4())
+        if not skip_mkdir:
+            output_dir.mkdir(parents=True, exist_ok=True)
+        file_id = filename_prefix or f"{int(time.time())}_{secrets.token_hex(4)}"
         extension = _extension_for_output_format(output_format)
         output_path = output_dir / f"{file_id}.{extension}"
+        voice_settings = _voice_settings_for(profile)
+        self._local.response_headers = {}
 
-        if save_metadata:
+        payload: dict[str, Any] | None = None
+        if include_timestamps:
+            # Timestamps are only available from the non-streaming endpoint.
             response = self.client.text_to_speech.convert_with_timestamps(
                 voice_id=profile.voice_id,
                 output_format=output_format,
                 text=text,
                 model_id=profile.model_id,
-                voice_settings=VoiceSettings(
-                    stability=profile.stability,
-                    similarity_boost=profile.similarity_boost,
-                    style=profile.style_exaggeration,
-                    speed=profile.speed,
-                ),
+                voice_settings=voice_settings,
             )
-            payload = _to_serializable(response)
-            audio_bytes = _extract_audio_bytes(payload, response)
-            _write_audio_file(output_path, output_format, audio_bytes)
-
-            metadata_path = output_dir / f"{file_id}.json"
-            payload_without_audio = {
-                k: v
-                for k, v in payload.items()
-                if k not in {"audio_base64", "audio_base_64", "audio"}
-            }
-            metadata = {
-                "provider": "elevenlabs",
-                "profile_name": profile.name,
-                "voiceProfile": {
-                    "profileId": profile.profile_id,
-                    "voiceId": profile.voice_id,
-                    "modelId": profile.model_id,
-                    "stability": profile.stability,
-                    "similarityBoost": profile.similarity_boost,
-                    "styleExaggeration": profile.style_exaggeration,
-                    "speed": profile.speed,
-                },
-                "output_format": output_format,
-                "text": text,
-                "response": payload_without_audio,
-            }
-            with metadata_path.open("w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=True)
-            return output_path, metadata_path
-
-        response = self.client.text_to_speech.convert(
+            payload, audio = _to_serializable(response)
+            _write_response_audio(output_path, output_format, payload, audio)
+        else:
+            response = self.client.text_to_speech.convert(
+                voice_id=profile.voice_id,
+                output_format=output_format,
+                text=text,
+                model_id=profile.model_id,
+                voice_settings=voice_settings,
+            )
+            _stream_to_file(response, output_path, output_format)
+
+        if not save_metadata:
+            return output_path, None
+
+        metadata_path = output_dir / f"{file_id}.json"
+        metadata = {
+            "provider": "elevenlabs",
+            "profile_name": profile.name,
+            "voiceProfile": {
+                "profileId": profile.profile_id,
+                "voiceId": profile.voice_id,
+                "modelId": profile.model_id,
+                "stability": profile.stability,
+                "similarityBoost": profile.similarity_boost,
+                "styleExaggeration": profile.style_exaggeration,
+                "speed": profile.speed,
+            },
+            "output_format": output_format,
+            "text": text,
+            "response_headers": self._local.response_headers,
+        }
+        if payload is not None:
+            metadata["response"] = payload
+        _write_metadata(metadata_path, metadata)
+        return output_path, metadata_path
+
+    def stream_to_player(self, text: str, profile: VoiceProfile) -> None:
+        if not shutil.which("ffplay"):
+            raise RuntimeError("Streaming playback requires ffplay (part of FFmpeg).")
+        response = self.client.text_to_speech.stream(
             voice_id=profile.voice_id,
-            output_format=output_format,
+            output_format="pcm_16000",
             text=text,
             model_id=profile.model_id,
-            voice_settings=VoiceSettings(
-                stability=profile.stability,
-                similarity_boost=profile.similarity_boost,
-                style=profile.style_exaggeration,
-                speed=profile.speed,
-            ),
+            voice_settings=_voice_settings_for(profile),
         )
-        if output_format == "pcm_16000":
-            raw_audio = bytearray()
-            for chunk in response:
-                if chunk:
-                    raw_audio.extend(chunk)
-            _write_audio_file(output_path, output_format, bytes(raw_audio))
-            return output_path, None
-        with output_path.open("wb") as f:
+        # Raw PCM is piped to ffplay as it arrives, so playback starts after
+        # the first chunk instead of after the whole clip is synthesized.
+        command = [
+            "ffplay",
+            "-nodisp",
+            "-autoexit",
+            "-loglevel",
+            "error",
+            "-f",
+            "s16le",
+            "-ar",
+            "16000",
+            "-i",
+            "pipe:0",
+        ]
+        player = subprocess.Popen(command, stdin=subprocess.PIPE)
+        try:
             for chunk in response:
                 if chunk:
-                    f.write(chunk)
-        return output_path, None
-
-
-def _to_serializable(obj: Any) -> dict[str, Any]:
-    if isinstance(obj, dict):
-        return obj
-    if hasattr(obj, "model_dump"):
-        dumped = obj.model_dump(by_alias=True)
-        if isinstance(dumped, dict):
-            return dumped
-        dumped = obj.model_dump()
-        if isinstance(dumped, dict):
-            return dumped
-    if hasattr(obj, "dict"):
-        dumped = obj.dict()
-        if isinstance(dumped, dict):
-            return dumped
-    if hasattr(obj, "__dict__"):
-        data = dict(obj.__dict__)
-        if isinstance(data, dict):
-            return data
-    raise ValueError("Unable to serialize ElevenLabs response payload.")
-
-
-def _extract_audio_bytes(payload: dict[str, Any], response_obj: Any) -> bytes:
-    candidates: list[Any] = [
-        payload.get("audio_base64"),
-        payload.get("audio_base_64"),
-        payload.get("audio"),
-    ]
-    for attr in ("audio_base64", "audio_base_64", "audio"):
-        if hasattr(response_obj, attr):
-            candidates.append(getattr(response_obj, attr))
-
-    for value in candidates:
-        if value is None:
-            continue
-        if isinstance(value, bytes):
-            return value
-        if isinstance(value, str):
+                    player.stdin.write(chunk)
+                    # Push each chunk through now; the default 8 KiB pipe buffer
+                    # would otherwise hold back the first ~250 ms of audio.
+                    player.stdin.flush()
+        except BrokenPipeError:
+            # The player exited early (e.g. the user closed it); stop sending.
+            pass
+        finally:
             try:
-                return base64.b64decode(value)
-            except Exception:
-                continue
+                player.stdin.close()
+            except BrokenPipeError:
+                pass
+            returncode = player.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, command)
+
+    def _capture_response_headers(self, response: httpx.Response) -> None:
+        # httpx runs response hooks on the calling thread, so a thread-local
+        # keeps concurrent batch requests from seeing each other's headers.
+        self._local.response_headers = dict(response.headers)
+
+
+@lru_cache(maxsize=128)
+def _voice_settings_for(profile: VoiceProfile) -> VoiceSettings:
+    return VoiceSettings(
+        stability=profile.stability,
+        similarity_boost=profile.similarity_boost,
+        style=profile.style_exaggeration,
+        speed=profile.speed,
+    )
+
+
+def _to_serializable(
+    obj: Any, audio_fields: tuple[str, ...] = _AUDIO_KEYS
+) -> tuple[dict[str, Any], Any]:
+    if isinstance(obj, BaseModel):
+        # SDK models allow extra fields, and the raw "audio_base64" key can end
+        # up stored as one; exclude= does not reach extras, so pop below.
+        payload = obj.model_dump(by_alias=True, mode="json")
+    elif isinstance(obj, dict):
+        payload = dict(obj)
+    elif hasattr(obj, "__dict__"):
+        payload = dict(obj.__dict__)
+    else:
+        raise ValueError("Unable to serialize ElevenLabs response payload.")
+    audio = None
+    for field in audio_fields:
+        value = payload.pop(field, None)
+        if audio is None:
+            audio = value
+    return payload, audio
+
+
+def _write_response_audio(
+    path: Path, output_format: str, payload: dict[str, Any], audio: Any
+) -> None:
+    if isinstance(audio, bytes):
+        _write_audio_file(path, output_format, audio)
+        return
+    if isinstance(audio, str):
+        # Decode slice by slice so the full clip never sits in memory twice.
+        with _open_audio_writer(path, output_format) as f:
+            for start in range(0, len(audio), _BASE64_DECODE_CHUNK):
+                end = start + _BASE64_DECODE_CHUNK
+                f.write(binascii.a2b_base64(audio[start:end]))
+        return
 
     keys = ", ".join(sorted(payload.keys()))
     raise ValueError(
@@ -154,6 +267,15 @@ def _extract_audio_bytes(payload: dict[str, Any], response_obj: Any) -> bytes:
     )
 
 
+def _write_metadata(path: Path, metadata: dict[str, Any]) -> None:
+    try:
+        payload = orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+    except orjson.JSONEncodeError:
+        # orjson rejects a few types stdlib json accepts (e.g. >64-bit ints).
+        payload = json.dumps(metadata, indent=2, ensure_ascii=False).encode("utf-8")
+    path.write_bytes(payload)
+
+
 def _extension_for_output_format(output_format: str) -> str:
     if output_format == "pcm_16000":
         return "wav"
@@ -164,13 +286,99 @@ def _write_audio_file(path: Path, output_format: str, audio_bytes: bytes) -> Non
     if output_format == "pcm_16000":
         _write_pcm_16khz_wav(path, audio_bytes)
         return
-    with path.open("wb") as f:
-        f.write(audio_bytes)
+    _write_buffers(path, [audio_bytes])
 
 
 def _write_pcm_16khz_wav(path: Path, pcm_bytes: bytes) -> None:
-    with wave.open(str(path), "wb") as wav_file:
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(16000)
-        wav_file.writeframes(pcm_bytes)
+    _write_buffers(path, [_pcm16k_header(len(pcm_bytes)), pcm_bytes])
+
+
+def _pcm16k_header(data_size: int) -> bytes:
+    header = bytearray(_PCM16K_HEADER_TEMPLATE)
+    struct.pack_into("<I", header, 4, data_size + 36)
+    struct.pack_into("<I", header, 40, data_size)
+    return bytes(header)
+
+
+def _write_buffers(path: Path, buffers: list[bytes]) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        views = [memoryview(b) for b in buffers]
+        while views:
+            written = os.writev(fd, views)
+            while views and written >= len(views[0]):
+                written -= len(views[0])
+                views.pop(0)
+            if views:
+                views[0] = views[0][written:]
+    finally:
+        os.close(fd)
+
+
+def _stream_to_file(chunks: Iterable[bytes], path: Path, output_format: str) -> None:
+    # Receive on this thread and write on another so network and disk overlap.
+    chunk_queue: queue.Queue[bytes | None] = queue.Queue(maxsize=_STREAM_QUEUE_SIZE)
+    errors: list[BaseException] = []
+    writer = threading.Thread(
+        target=_drain_to_file, args=(chunk_queue, path, output_format, errors)
+    )
+    writer.start()
+    failed = True
+    try:
+        for chunk in chunks:
+            if errors:
+                break
+            if chunk:
+                chunk_queue.put(chunk)
+        failed = False
+    finally:
+        chunk_queue.put(None)
+        writer.join()
+        if failed or errors:
+            # Don't leave a truncated (or header-only) file behind.
+            path.unlink(missing_ok=True)
+    if errors:
+        raise errors[0]
+
+
+def _drain_to_file(
+    chunk_queue: queue.Queue[bytes | None],
+    path: Path,
+    output_format: str,
+    errors: list[BaseException],
+) -> None:
+    sentinel_seen = False
+    try:
+        with _open_audio_writer(path, output_format) as f:
+            while (chunk := chunk_queue.get()) is not None:
+                f.write(chunk)
+            sentinel_seen = True
+    except BaseException as exc:
+        errors.append(exc)
+        # Keep consuming so the producer never blocks on a full queue. If the
+        # failure came from the final flush/header patch, the sentinel has
+        # already been taken and nothing more will arrive.
+        while not sentinel_seen:
+            sentinel_seen = chunk_queue.get() is None
+
+
+@contextmanager
+def _open_audio_writer(path: Path, output_format: str) -> Iterator[BinaryIO]:
+    if output_format == "pcm_16000":
+        with _open_pcm_wav(path) as f:
+            yield f
+        return
+    with open(path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        yield f
+
+
+@contextmanager
+def _open_pcm_wav(path: Path) -> Iterator[BinaryIO]:
+    # A zero-length header is written up front and patched with the real
+    # sizes once all PCM data has been streamed in.
+    with open(path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(_PCM16K_HEADER_TEMPLATE)
+        yield f
+        data_size = f.tell() - len(_PCM16K_HEADER_TEMPLATE)
+        f.seek(0)
+        f.write(_pcm16k_header(data_size))
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
-import json
+import hashlib
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict
 
+import orjson
+
+# Bump whenever VoiceProfile or _build_profile changes so stale pickles are ignored.
+_CACHE_VERSION = 1
+
 
 @dataclass(frozen=True)
 class VoiceProfile:
@@ -53,10 +61,29 @@ def _load_from_directory(config_dir: Path) -> tuple[dict[str, VoiceProfile], str
     if not files:
         raise ValueError(f"No profile JSON files found in {config_dir}")
 
+    default_profile_path = config_dir / "default_profile.txt"
+    cache_key = _cache_key([*files, default_profile_path])
+    cache_path = _cache_path(config_dir)
+    if cache_path is not None:
+        cached = _read_cache(cache_path, cache_key)
+        if cached is not None:
+            return cached
+
+    result = _parse_directory(files, default_profile_path)
+    if cache_path is not None:
+        _write_cache(cache_path, cache_key, result)
+    return result
+
+
+def _parse_directory(
+    files: list[Path], default_profile_path: Path
+) -> tuple[dict[str, VoiceProfile], str]:
+    # Overlap per-file reads; this matters when config lives on network storage.
+    with ThreadPoolExecutor(max_workers=min(32, len(files))) as executor:
+        items = list(executor.map(_read_profile_file, files))
+
     profiles: Dict[str, VoiceProfile] = {}
-    for file_path in files:
-        with file_path.open("r", encoding="utf-8") as f:
-            item = json.load(f)
+    for file_path, item in zip(files, items):
         profile_name = file_path.stem
         profile_id = item.get("profileId")
         if profile_id != profile_name:
@@ -66,13 +93,62 @@ def _load_from_directory(config_dir: Path) -> tuple[dict[str, VoiceProfile], str
             )
         profiles[profile_name] = _build_profile(profile_name, item)
 
-    default_profile_path = config_dir / "default_profile.txt"
-    default_profile = (
-        default_profile_path.read_text(encoding="utf-8").strip()
-        if default_profile_path.exists()
-        else ""
-    )
+    try:
+        default_profile = default_profile_path.read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        default_profile = ""
     if default_profile not in profiles:
         default_profile = next(iter(profiles))
 
     return profiles, default_profile
+
+
+def _read_profile_file(file_path: Path) -> dict:
+    return orjson.loads(file_path.read_bytes())
+
+
+def _cache_key(paths: list[Path]) -> tuple:
+    key: list = [_CACHE_VERSION]
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            key.append((path.name, None, None))
+            continue
+        key.append((path.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(key)
+
+
+def _cache_path(config_dir: Path) -> Path | None:
+    try:
+        cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    except RuntimeError:
+        # No HOME and no passwd entry (e.g. minimal containers): skip caching.
+        return None
+    digest = hashlib.sha1(str(config_dir.resolve()).encode("utf-8")).hexdigest()
+    return Path(cache_home) / "tts_test" / f"voice_profiles-{digest[:16]}.pkl"
+
+
+def _read_cache(
+    cache_path: Path, cache_key: tuple
+) -> tuple[dict[str, VoiceProfile], str] | None:
+    try:
+        with cache_path.open("rb") as f:
+            stored_key, result = pickle.load(f)
+    except Exception:
+        return None
+    return result if stored_key == cache_key else None
+
+
+def _write_cache(
+    cache_path: Path, cache_key: tuple, result: tuple[dict[str, VoiceProfile], str]
+) -> None:
+    # The cache is only an optimisation; an unwritable cache dir is not an error.
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("wb") as f:
+            pickle.dump((cache_key, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
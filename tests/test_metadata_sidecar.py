@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import base64
+import json
+import sys
+import wave
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from tts_test.elevenlabs_tts import ElevenLabsTTS
+from tts_test.voice_profiles import VoiceProfile
+
+PROFILE = VoiceProfile(
+    name="test_profile",
+    profile_id="test_profile",
+    voice_id="voice123",
+    model_id="eleven_multilingual_v2",
+    stability=0.5,
+    similarity_boost=0.5,
+    style_exaggeration=0.0,
+    speed=1.0,
+)
+PCM = b"\x01\x00" * 4000
+
+
+def _timestamps_response(request: httpx.Request) -> httpx.Response:
+    alignment = {
+        "characters": ["h", "i"],
+        "character_start_times_seconds": [0.0, 0.1],
+        "character_end_times_seconds": [0.1, 0.2],
+    }
+    return httpx.Response(
+        200,
+        json={
+            "audio_base64": base64.b64encode(PCM).decode("ascii"),
+            "alignment": alignment,
+            "normalized_alignment": alignment,
+        },
+        headers={"request-id": "req-1"},
+    )
+
+
+def test_timestamps_sidecar_excludes_audio(tmp_path: Path) -> None:
+    with ElevenLabsTTS(api_key="test-key") as tts:
+        tts._httpx._transport = httpx.MockTransport(_timestamps_response)
+        output_path, metadata_path = tts.text_to_speech_file(
+            text="hi",
+            profile=PROFILE,
+            output_dir=tmp_path,
+            output_format="pcm_16000",
+            filename_prefix="line",
+            include_timestamps=True,
+        )
+
+    metadata = json.loads(metadata_path.read_bytes())
+    response = metadata["response"]
+    assert not {"audio_base64", "audio_base_64", "audio"} & set(response)
+    assert response["alignment"]["characters"] == ["h", "i"]
+    assert metadata["response_headers"]["request-id"] == "req-1"
+    with wave.open(str(output_path), "rb") as wav_file:
+        assert wav_file.readframes(wav_file.getnframes()) == PCM